@@ -1,12 +1,14 @@
 """
 Text-based minesweeper game. Only has basic functionality.
 """
-from typing import List, Tuple
+from collections import deque
+from typing import Iterable, List, Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import ArrayLike
 
 ADJACENT_SPACE_DELTAS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-SURROUNDING_SPACE_DELTAS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
 
 
 class Game:
@@ -41,12 +43,7 @@ class Game:
 
         while game_status == 0:
             user_input = input("Enter your move (e.g. '1,3,0'): ")
-            s = user_input.split(",")
-            row = int(s[0])
-            col = int(s[1])
-            flag = bool(int(s[2]))
-
-            game_status = self.board.step(row, col, flag)
+            game_status = self.step_from_str(user_input)
             self.board.display_visible()
 
         if game_status == -1:
@@ -54,6 +51,32 @@ class Game:
         else:
             print("You win! Congratulations!")
 
+    def step_from_str(self, line: str) -> int:
+        """
+        Plays one move, given in the same 'row, col, flag' form that `play` accepts.
+
+        :param line: the move, e.g. '1,3,0'
+        :return: resultant game status; 0 is ongoing, -1 is lost, 1 is won
+        """
+        row, col, flag = map(int, line.split(","))
+        return self.board.step(row, col, bool(flag))
+
+    def play_script(self, lines: Iterable[str]) -> int:
+        """
+        Plays a sequence of moves without prompting for input or printing the board, e.g. for replays or bots. Stops
+        once the game is over; any remaining moves are not played.
+
+        :param lines: moves, each in the 'row, col, flag' form that `play` accepts
+        :return: resultant game status; 0 is ongoing, -1 is lost, 1 is won
+        """
+        game_status = 0
+        for line in lines:
+            game_status = self.step_from_str(line)
+            if game_status != 0:
+                break
+
+        return game_status
+
     def reset(self) -> None:
         """
         Reset the game.
@@ -69,7 +92,7 @@ class Board:
 
     def __init__(self, board_size: int, num_mines: int):
         """
-        Initialize the board. The internal board state is represented with a number in each element,
+        Initialize the board. The internal board state is represented with a number (int8) in each element,
         with the following meanings:
         -1: mine
         0: no mines in adjacent spaces (i.e. displayed as blank space)
@@ -80,72 +103,75 @@ class Board:
         """
         self.board_size = board_size
         self.num_mines = num_mines
-        self.board = np.zeros((self.board_size, self.board_size), dtype=int)
+        self.board = np.zeros((self.board_size, self.board_size), dtype=np.int8)
 
         # Add mines randomly
         mine_flattened_locs = np.random.choice(board_size ** 2, num_mines, replace=False)
-        for flat_loc in mine_flattened_locs:
-            loc = (flat_loc // board_size, flat_loc % board_size)
-            self.board[loc] = -1
-        for row in range(board_size):
-            for col in range(board_size):
-                if self.board[row, col] != -1:
-                    self.board[row, col] = self._num_mines_surrounding(row, col)
+        mine_rows, mine_cols = np.unravel_index(mine_flattened_locs, (board_size, board_size))
+        self.board[mine_rows, mine_cols] = -1
+
+        # Count surrounding mines for every space at once, by summing the mine mask over the 3x3 window around each
+        # space. The space itself only adds to the sum if it's a mine, and mines are set back to -1 anyway.
+        mines = self.board == -1
+        counts = sliding_window_view(np.pad(mines.astype(np.int8), 1), (3, 3)).sum(axis=(2, 3), dtype=np.int8)
+        self.board = np.where(mines, -1, counts).astype(np.int8)
+        # Copy of the board surrounded by a border of sentinel (-2) spaces, so neighbor lookups need no bounds checks
+        self._board_padded = np.full((board_size + 2, board_size + 2), -2, dtype=np.int8)
+        self._board_padded[1:-1, 1:-1] = self.board
+        # Display str of each space (mines shown as *), computed once since the board doesn't change after this
+        self._board_str = np.where(self.board == -1, "*", self.board.astype("U2"))
+
+        # Label the adjacent-connected regions of blank spaces (0 for other spaces), so that uncovering a region needs
+        # no search. For each region (indexed by label - 1), precompute the spaces uncovered when clicking it: the
+        # region and its surrounding numbered spaces. Stored as a mask over the region's bounding box, grown by one
+        # space.
+        self._labels = np.zeros((board_size, board_size), dtype=np.int32)
+        self._region_reveals: List[Tuple[Tuple[slice, slice], np.ndarray]] = []
+        for row, col in np.argwhere(self.board == 0).tolist():
+            if self._labels[row, col] != 0:
+                continue
+            label = len(self._region_reveals) + 1
+            rows, cols = np.array(self._connected_blank_spaces(row, col)).T
+            self._labels[rows, cols] = label
+
+            window = (slice(max(rows.min() - 1, 0), rows.max() + 2), slice(max(cols.min() - 1, 0), cols.max() + 2))
+            region = self._labels[window] == label
+            surrounding = sliding_window_view(np.pad(region, 1), (3, 3)).any(axis=(2, 3))
+            reveal = region | (surrounding & (self.board[window] > 0))
+            self._region_reveals.append((window, reveal))
 
         self.visibility = np.zeros((board_size, board_size), dtype=bool)
         self.flags = np.zeros((board_size, board_size), dtype=bool)
-
-    def _within_board(self, row: int, col: int) -> bool:
-        """
-        Whether or not the row / col is inside the board.
-
-        :param row: row of position
-        :param col: col of position
-        :return:
-        """
-        return (0 <= row < self.board_size) and (0 <= col < self.board_size)
-
-    def _num_mines_surrounding(self, row: int, col: int) -> int:
-        """
-        Number of mines surrounding this particular position
-
-        :param row: row of position
-        :param col: col of position
-        :return: number of mines surrounding
-        """
-        mines = 0
-        for row_delta, col_delta in SURROUNDING_SPACE_DELTAS:
-            curr_row = row + row_delta
-            curr_col = col + col_delta
-            within_board = self._within_board(curr_row, curr_col)
-
-            if within_board and self.board[curr_row, curr_col] == -1:
-                mines += 1
-
-        return mines
+        self._visible_count = 0
+        self._num_safe_spaces = board_size ** 2 - num_mines
 
     def _connected_blank_spaces(self, row: int, col: int) -> List[Tuple[int, int]]:
         """
         Identifies a list of all blank spaces within an adjacent-connected region to the identified position.
-        Uses a BFS to search for this.
+        Uses a BFS to search for this. Only used to label the regions when initializing the board.
 
         :param row: row of position
         :param col: col of position
         :return: list of positions
         """
-        spaces = [(row, col)]
-        queue = [(row, col)]
+        # search in padded coordinates; the sentinel border is never blank, so the search stays inside the board
+        row, col = row + 1, col + 1
+        board = self._board_padded
+        visited = np.zeros_like(board, dtype=bool)
+        visited[row, col] = True
+        spaces = [(row - 1, col - 1)]
+        queue = deque([(row, col)])
 
         while len(queue) > 0:
-            row, col = queue.pop(0)
+            row, col = queue.popleft()
             for row_delta, col_delta in ADJACENT_SPACE_DELTAS:
                 curr_row = row + row_delta
                 curr_col = col + col_delta
-                within_board = self._within_board(curr_row, curr_col)
 
-                if within_board and self.board[curr_row, curr_col] == 0 and (curr_row, curr_col) not in spaces:
+                if board[curr_row, curr_col] == 0 and not visited[curr_row, curr_col]:
+                    visited[curr_row, curr_col] = True
                     queue.append((curr_row, curr_col))
-                    spaces.append((curr_row, curr_col))
+                    spaces.append((curr_row - 1, curr_col - 1))
 
         return spaces
 
@@ -161,43 +187,56 @@ class Board:
         """
         if flag:
             self.flags[row, col] = not self.flags[row, col]
+        elif self.visibility[row, col] and self.board[row, col] != -1:
+            # already uncovered, so there is nothing new to uncover
+            pass
         elif self.board[row, col] > 0:
             self.visibility[row, col] = True
+            self._visible_count += 1
         elif self.board[row, col] == 0:
             # uncover all connected blank spaces and surrounding non-mine spaces
-            blank_spaces = self._connected_blank_spaces(row, col)
-            for space_row, space_col in blank_spaces:
-                self.visibility[space_row, space_col] = True
-                for row_delta, col_delta in SURROUNDING_SPACE_DELTAS:
-                    curr_row = space_row + row_delta
-                    curr_col = space_col + col_delta
-                    within_board = self._within_board(curr_row, curr_col)
-                    if within_board and self.board[curr_row, curr_col] > 0:
-                        self.visibility[curr_row, curr_col] = True
+            window, reveal = self._region_reveals[self._labels[row, col] - 1]
+            visibility = self.visibility[window]
+            added = int(np.count_nonzero(reveal & ~visibility))
+            visibility |= reveal
+            self._visible_count += added
         else:
             # only lose if it you click a mine and it's not flagged. If flagged, do nothing.
             if not self.flags[row, col]:
                 self.visibility[row, col] = True
                 return -1
 
-        if np.sum(self.visibility) == self.board_size ** 2 - self.num_mines:
+        if self._visible_count == self._num_safe_spaces:
             return 1
         else:
             return 0
 
+    def step_many(self, moves: ArrayLike) -> np.ndarray:
+        """
+        Plays a batch of moves, e.g. for bots. A convenience over calling `step` on each move in turn, which also
+        collects the game statuses. Once the game is over, the remaining moves are not played.
+
+        :param moves: integers of shape (M, 3), e.g. an array or list of lists, where each row is a move
+            (row, col, flag) as in `step`
+        :return: int8 array of shape (M,), with the resultant game status after each move. Moves that weren't played
+            because the game was over have the final game status.
+        """
+        moves = np.asarray(moves)
+        game_statuses = np.zeros(len(moves), dtype=np.int8)
+        for i, (row, col, flag) in enumerate(moves.tolist()):
+            game_status = self.step(row, col, bool(flag))
+            if game_status != 0:
+                game_statuses[i:] = game_status
+                break
+
+        return game_statuses
+
     def display_visible(self) -> None:
         """
-        Prints out the visible board. Each element will be converted to a str, and then hidden (?) or flagged (F)
-        depending on the space.
-        """
-        d = self.board.astype(str)
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                if not self.visibility[row, col]:
-                    if self.flags[row, col]:
-                        d[row, col] = "F"
-                    else:
-                        d[row, col] = "?"
+        Prints out the visible board. Each element will be shown as its str (mines as *), or as hidden (?) or flagged
+        (F) depending on the space.
+        """
+        d = np.where(self.visibility, self._board_str, np.where(self.flags, "F", "?"))
         print(d)
 
 
@@ -2,7 +2,7 @@
 Test the text-based minesweeper game.
 """
 import numpy as np
-from text_minesweeper.game import Board
+from text_minesweeper.game import Board, Game
 
 
 def test_lose():
@@ -32,4 +32,107 @@ def test_win():
     b.display_visible()
 
 
-# TODO: implement test cases for flag and Game
+def test_step_many():
+    np.random.seed(1)
+    b = Board(5, 5)
+    moves = np.array([[0, 0, 0], [4, 4, 0], [4, 2, 0], [4, 0, 0], [0, 4, 0], [1, 4, 0], [1, 3, 0]], dtype=np.int8)
+    assert b.step_many(moves).tolist() == [0, 0, 0, 0, 0, 0, 1]
+
+    np.random.seed(1)
+    b = Board(5, 5)
+    moves = np.array([[0, 0, 0], [2, 3, 0], [4, 4, 0]], dtype=np.int8)
+    assert b.step_many(moves).tolist() == [0, -1, -1]
+    assert not b.visibility[4, 4]
+
+    np.random.seed(1)
+    b = Board(5, 5)
+    assert b.step_many([[0, 0, 0], [4, 4, 0], [0, 4, 1]]).tolist() == [0, 0, 0]
+    assert b.flags[0, 4]
+    assert b.step_many(np.array([[0, 4, 1], [2, 3, 0]], dtype=np.int64)).tolist() == [0, -1]
+    assert not b.flags[0, 4]
+
+
+def test_board_numbers():
+    np.random.seed(502083728)
+    b = Board(9, 12)
+
+    expected = np.array(
+        [
+            [0, 1, -1, 2, -1, 1, 0, 2, -1],
+            [1, 2, 2, 2, 2, 2, 2, 3, -1],
+            [2, -1, 2, 0, 1, -1, 3, -1, 3],
+            [2, -1, 3, 1, 2, 1, 3, -1, 2],
+            [1, 1, 2, -1, 1, 0, 1, 1, 1],
+            [0, 1, 2, 3, 2, 1, 0, 0, 0],
+            [0, 1, -1, 2, -1, 1, 0, 0, 0],
+            [0, 1, 1, 2, 1, 1, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        ]
+    )
+    assert np.array_equal(b.board, expected)
+
+
+def test_uncover_blank_region():
+    # the blank regions at (5, 6) and (4, 5) only touch diagonally, so uncovering one doesn't uncover the other
+    np.random.seed(502083728)
+    b = Board(9, 12)
+
+    expected = np.array(
+        [
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [1, 1, 0, 0, 0, 0, 1, 1, 1],
+            [1, 1, 0, 0, 0, 1, 1, 1, 1],
+            [1, 1, 0, 0, 0, 1, 1, 1, 1],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1],
+        ],
+        dtype=bool,
+    )
+    assert b.step(8, 7, False) == 0
+    assert np.array_equal(b.visibility, expected)
+
+
+def test_repeat_uncover():
+    np.random.seed(1)
+    b = Board(5, 5)
+
+    assert b.step(0, 0, False) == 0
+    assert b.step(4, 4, False) == 0
+    visibility = b.visibility.copy()
+    assert b.step(0, 0, False) == 0
+    assert b.step(4, 4, False) == 0
+    assert np.array_equal(b.visibility, visibility)
+
+    # repeat uncovers aren't counted again, so the game is won exactly when the last safe space is uncovered
+    assert b.step(4, 2, False) == 0
+    assert b.step(4, 0, False) == 0
+    assert b.step(0, 4, False) == 0
+    assert b.step(1, 4, False) == 0
+    assert b.step(1, 3, False) == 1
+    assert b.step(1, 3, False) == 1
+
+
+def test_repeat_uncover_mine():
+    np.random.seed(1)
+    b = Board(5, 5)
+
+    assert b.step(2, 3, False) == -1
+    assert b.step(2, 3, False) == -1
+
+
+def test_game_play_script():
+    np.random.seed(1)
+    g = Game(5, 5)
+    assert g.play_script(["0,0,0", "4, 4, 0", "4,2,0"]) == 0
+    assert g.play_script(["4,0,0", "0,4,0", "1,4,0", "1,3,0"]) == 1
+
+    np.random.seed(1)
+    g = Game(5, 5)
+    assert g.play_script(["0,0,0", "2,1,0", "1,3,0", "2,3,0", "4,4,0"]) == -1
+    assert not g.board.visibility[4, 4]
+
+
+# TODO: implement test cases for flag